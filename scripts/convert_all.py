@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Run the full conversion pipeline: raw sessions -> llm events -> chat data.
+
+Equivalent to running convert_raw.py followed by make_chat_data.py over the
+same data root. Per-task work is independent, so both stages fan out across
+a process pool by default.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Tuple
+
+from convert_raw import (
+    convert_to_llm_format,
+    find_task_directories,
+    load_all_tasks,
+    write_json,
+)
+from make_chat_data import build_messages_for_task, read_llm_events, write_jsonl
+
+
+def _process_one_task_events(args: Tuple[str, dict, str]) -> str:
+    """Convert one task's session data and write its llm_events.json."""
+    task_name, session, data_root_str = args
+    llm_events = convert_to_llm_format(task_name, session.get("events", []))
+    out_path = Path(data_root_str) / task_name / "llm_events.json"
+    write_json(llm_events, out_path)
+    print(f"✓ events: {task_name} ({len(llm_events)})")
+    return str(out_path)
+
+
+def _process_one_chat(task_dir_str: str) -> str:
+    """Build one task's chat.jsonl from its llm_events.json."""
+    task_dir = Path(task_dir_str)
+    events = read_llm_events(task_dir)
+    messages, attachments = build_messages_for_task(task_dir.name, events)
+    rec = {"task": task_dir.name, "messages": messages, "attachments": attachments}
+    out_path = task_dir / "chat.jsonl"
+    write_jsonl([rec], out_path)
+    print(f"✓ chat: {task_dir.name} ({len(messages)} messages)")
+    return str(out_path)
+
+
+def run_convert_events(data_root: Path, workers: int = 1) -> None:
+    """Convert every task's session_data.json into llm_events.json."""
+    tasks = [
+        (task_name, session, str(data_root))
+        for task_name, session in load_all_tasks(data_root)
+    ]
+    if workers == 1:
+        for task in tasks:
+            _process_one_task_events(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_process_one_task_events, tasks, chunksize=4))
+
+
+def run_make_chat(data_root: Path, workers: int = 1) -> None:
+    """Build chat.jsonl for every task that has llm_events.json."""
+    task_dirs = [
+        str(p)
+        for p in find_task_directories(data_root)
+        if (p / "llm_events.json").exists()
+    ]
+    if workers == 1:
+        for task_dir in task_dirs:
+            _process_one_chat(task_dir)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_process_one_chat, task_dirs, chunksize=4))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-root", default="data", help="Recorder output directory")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Worker processes per stage (1 runs sequentially)",
+    )
+    args = parser.parse_args()
+
+    data_root = Path(args.data_root)
+    run_convert_events(data_root, workers=args.workers)
+    run_make_chat(data_root, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
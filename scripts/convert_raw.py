@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Convert raw session_data.json captures into flat llm_events.json files.
+
+Walks every task directory under the data root produced by the recorder,
+flattens its event stream (clicks, merged keystrokes, scroll sequences)
+into the simplified format consumed by make_chat_data.py, and writes it
+back as data/<task>/llm_events.json.
+"""
+
+import argparse
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+except ImportError:  # pragma: no cover - orjson is expected, json is the fallback
+    import json
+
+    def _loads(data: Any) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional; large files fall back to full loads
+    ijson = None
+
+# Key events that get merged into a single "type" action downstream.
+KEY_EVENT_TYPES = ("type", "key_combination")
+
+# Session files above this size are streamed event-by-event instead of being
+# materialized as one tree.
+_STREAM_THRESHOLD = 8 << 20
+
+
+def find_task_directories(data_root: Path) -> List[Path]:
+    """Return all task directories under the data root, sorted by name."""
+    if not data_root.is_dir():
+        return []
+    # Sort the DirEntry objects by name before wrapping in Path: is_dir() is
+    # answered from the scandir cache and Path.__lt__ comparisons are avoided.
+    entries = [entry for entry in os.scandir(data_root) if entry.is_dir()]
+    entries.sort(key=lambda entry: entry.name)
+    return [Path(entry.path) for entry in entries]
+
+
+# Files below this size are read into a reusable per-thread scratch buffer
+# instead of allocating fresh bytes per file. Per-thread because
+# load_all_tasks reads from a thread pool.
+_SCRATCH_SIZE = 1 << 20
+_scratch_local = threading.local()
+
+
+def read_json_buffer(path: Path) -> Union[bytes, memoryview]:
+    """Read a JSON file as bytes, reusing a scratch buffer for small files.
+
+    The returned memoryview aliases a per-thread buffer, so callers must
+    finish parsing it before their next read_json_buffer call.
+    """
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        if size >= _SCRATCH_SIZE:
+            return f.read()
+        buf = getattr(_scratch_local, "buf", None)
+        if buf is None:
+            buf = _scratch_local.buf = bytearray(_SCRATCH_SIZE)
+        n = f.readinto(buf)
+        return memoryview(buf)[:n]
+
+
+def load_session_json(session_path: Path) -> Dict[str, Any]:
+    """Load one session_data.json file."""
+    return _loads(read_json_buffer(session_path))
+
+
+def iter_session_events(session_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the events of one session, streaming large files via ijson.
+
+    For files above _STREAM_THRESHOLD this keeps peak memory at one event
+    instead of the whole session tree; small files take the fast full-load
+    path.
+    """
+    if ijson is not None and session_path.stat().st_size > _STREAM_THRESHOLD:
+        with session_path.open("rb") as f:
+            yield from ijson.items(f, "events.item")
+        return
+    yield from load_session_json(session_path).get("events", [])
+
+
+def _load_one_task(task_dir: Path) -> Optional[Tuple[str, Dict[str, Any]]]:
+    session_path = task_dir / "session_data.json"
+    if not session_path.exists():
+        return None
+    return task_dir.name, load_session_json(session_path)
+
+
+def load_all_tasks(data_root: Path) -> List[Tuple[str, Dict[str, Any]]]:
+    """Load (task_name, session) pairs for every task that has session data.
+
+    The per-file reads are overlapped in a thread pool: the GIL is released
+    while a thread blocks on disk, so many small session files load at the
+    latency of the slowest batch instead of the sum of all of them.
+    """
+    task_dirs = find_task_directories(data_root)
+    if not task_dirs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, len(task_dirs))) as ex:
+        loaded = list(ex.map(_load_one_task, task_dirs))
+    return [task for task in loaded if task is not None]
+
+
+def _screen_bounds(event: Dict[str, Any]) -> Dict[str, Any]:
+    return event.get("screenInfo", {}).get("currentDisplay", {}).get("bounds", {})
+
+
+def convert_to_llm_format(task_name: str, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten a recorded event stream into a list of llm events.
+
+    Accepts any iterable of events (a loaded list or the streaming iterator
+    from iter_session_events); only one event of lookahead is kept in memory.
+    Consecutive keystroke events (type / key_combination) are merged into a
+    single "type" event carrying the concatenated keys; the screenshot of
+    the last keystroke in the run is used. A trailing "stop" event pointing
+    at the final screenshot closes every task.
+    """
+    llm_events: List[Dict[str, Any]] = []
+    pending_keys: List[str] = []
+
+    # Only the event id varies in the screenshot path, so format the stem
+    # once and concatenate per event instead of running an f-string each
+    # iteration (including for event types that never use it).
+    ss_prefix = f"data/{task_name}/videos/frames_display_1/event_"
+
+    events_iter = iter(events)
+    event = next(events_iter, None)
+    while event is not None:
+        next_event = next(events_iter, None)
+        etype = event.get("type")
+
+        if etype in KEY_EVENT_TYPES:
+            pending_keys.append(event.get("combination") or event.get("key", ""))
+            next_is_key = next_event is not None and next_event.get("type") in KEY_EVENT_TYPES
+            if next_is_key:
+                event = next_event
+                continue
+            llm_events.append({
+                "type": "type",
+                "text": " ".join(pending_keys),
+                "timestamp": event.get("timestamp"),
+                "screenshot": ss_prefix + str(event.get("id")) + ".png",
+            })
+            pending_keys = []
+        elif etype == "click":
+            bounds = _screen_bounds(event)
+            llm_events.append({
+                "type": "click",
+                "x": event.get("x"),
+                "y": event.get("y"),
+                "button": event.get("button", "left"),
+                "screen_width": bounds.get("width"),
+                "screen_height": bounds.get("height"),
+                "timestamp": event.get("timestamp"),
+                "screenshot": ss_prefix + str(event.get("id")) + ".png",
+            })
+        elif etype == "scroll_sequence":
+            llm_events.append({
+                "type": "scroll",
+                "x": event.get("x"),
+                "y": event.get("y"),
+                "direction": event.get("direction"),
+                "amount": event.get("totalAmount"),
+                "timestamp": event.get("timestamp"),
+                "screenshot": ss_prefix + str(event.get("id")) + ".png",
+            })
+        # Other event types (drag, browser_window, ...) are not used downstream.
+        event = next_event
+
+    llm_events.append({
+        "type": "stop",
+        "screenshot": f"data/{task_name}/screenshots/final_display_1.png",
+    })
+    return llm_events
+
+
+def write_json(payload: Any, out_path: Path) -> None:
+    """Write payload as pretty-printed JSON."""
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("wb") as f:
+        f.write(_dumps(payload))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-root", default="data", help="Recorder output directory")
+    args = parser.parse_args()
+
+    data_root = Path(args.data_root)
+    for task_dir in find_task_directories(data_root):
+        session_path = task_dir / "session_data.json"
+        if not session_path.exists():
+            continue
+        llm_events = convert_to_llm_format(task_dir.name, iter_session_events(session_path))
+        out_path = task_dir / "llm_events.json"
+        write_json(llm_events, out_path)
+        print(f"✓ {task_dir.name}: {len(llm_events)} events -> {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Turn per-task llm_events.json files into chat-format training records.
+
+Each task becomes one record with a messages list (system / user / assistant
+turns referencing screenshots as <attachment:N>) and the parallel attachments
+list. Records are written per task as chat.jsonl and aggregated into a single
+chat_dataset.jsonl at the data root.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Tuple, Union
+
+from convert_raw import find_task_directories, read_json_buffer
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - orjson is expected, json is the fallback
+    import json
+
+    def _loads(data: Any) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+SYSTEM_PROMPT = (
+    "You are an agent viewing screenshots of a computer screen. "
+    "Respond with exactly one action per turn: "
+    "click <x> <y> (normalized 0-1), type <keys>, scroll <direction> <amount>, or stop."
+)
+
+# Shared across all tasks and never mutated downstream, so one dict each is
+# enough for the whole run.
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+_STOP_MSG = {"role": "assistant", "content": "stop"}
+
+
+def read_llm_events(task_dir: Path) -> List[Dict[str, Any]]:
+    """Load the llm_events.json for one task directory."""
+    return _loads(read_json_buffer(task_dir / "llm_events.json"))
+
+
+def build_messages_for_task(
+    task_name: str, events: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, str]], List[str]]:
+    """Build the chat messages and attachment list for one task."""
+    messages: List[Dict[str, str]] = [_SYSTEM_MSG]
+    attachments: List[str] = []
+    attachment_index = 0
+
+    # The screen size is constant within a task, so normalize clicks by a
+    # cached reciprocal instead of dividing per event.
+    last_size: Tuple[Any, Any] = (None, None)
+    inv_width = inv_height = 0.0
+
+    first_user_content = f"TASK:{task_name} <attachment:0>"
+
+    for event in events:
+        etype = event.get("type")
+        if etype == "click":
+            width = event.get("screen_width")
+            height = event.get("screen_height")
+            if not width or not height:
+                continue
+            if (width, height) != last_size:
+                inv_width = 1.0 / width
+                inv_height = 1.0 / height
+                last_size = (width, height)
+            rx = event["x"] * inv_width
+            ry = event["y"] * inv_height
+            assistant_msg = {"role": "assistant", "content": f"click {rx:.6f} {ry:.6f}"}
+        elif etype == "type":
+            assistant_msg = {"role": "assistant", "content": f"type {event.get('text', '')}"}
+        elif etype == "scroll":
+            assistant_msg = {
+                "role": "assistant",
+                "content": f"scroll {event.get('direction')} {event.get('amount')}",
+            }
+        elif etype == "stop":
+            assistant_msg = _STOP_MSG
+        else:
+            continue
+
+        # Every action shares the same user turn shape; build it once here
+        # instead of once per branch above.
+        if attachment_index == 0:
+            user_content = first_user_content
+        else:
+            user_content = f"<attachment:{attachment_index}>"
+        messages.append({"role": "user", "content": user_content})
+        messages.append(assistant_msg)
+        attachments.append(event["screenshot"])
+        attachment_index += 1
+
+    return messages, attachments
+
+
+def write_jsonl(
+    records: Iterable[Dict[str, Any]],
+    out: Union[Path, BinaryIO],
+    pretty: bool = False,
+) -> None:
+    """Write records as newline-delimited JSON to a path or an open binary file.
+
+    Accepting an already-open file lets callers stream many tasks into one
+    aggregate file without paying an open/close per call. Records are joined
+    in memory and written in a single call so the kernel sees one write
+    instead of two per record. pretty=True indents each record for human
+    debugging; the result is no longer line-oriented, so readers should only
+    use it by hand.
+    """
+    dumps = _dumps_pretty if pretty else _dumps
+    parts: List[bytes] = []
+    for rec in records:
+        parts.append(dumps(rec))
+        parts.append(b"\n")
+    payload = b"".join(parts)
+    if not isinstance(out, Path):
+        out.write(payload)
+        return
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("wb") as f:
+        f.write(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-root", default="data", help="Recorder output directory")
+    parser.add_argument(
+        "--per-task",
+        action="store_true",
+        help="Also write a chat.jsonl inside each task directory",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent records for human inspection (breaks line-oriented readers)",
+    )
+    args = parser.parse_args()
+
+    data_root = Path(args.data_root)
+    out_path = data_root / "chat_dataset.jsonl"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    # One aggregate file, opened once with a 1 MiB buffer, instead of an
+    # open/close round trip per task.
+    with open(out_path, "wb", buffering=1 << 20) as dataset:
+        for task_dir in find_task_directories(data_root):
+            if not (task_dir / "llm_events.json").exists():
+                continue
+            events = read_llm_events(task_dir)
+            messages, attachments = build_messages_for_task(task_dir.name, events)
+            rec = {"task": task_dir.name, "messages": messages, "attachments": attachments}
+            write_jsonl([rec], dataset, pretty=args.pretty)
+            if args.per_task:
+                write_jsonl([rec], task_dir / "chat.jsonl", pretty=args.pretty)
+            count += 1
+            print(f"✓ {task_dir.name}: {len(messages)} messages, {len(attachments)} attachments")
+
+    print(f"✓ Wrote {count} records to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Render each task's chat.jsonl into a review video.
+
+Every assistant action becomes one slide: the referenced screenshot on the
+left and the action text in a side panel on the right, held for a fixed
+duration. Output is data/<task>/chat_video.mp4.
+"""
+
+import argparse
+import functools
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import imageio
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from convert_raw import find_task_directories
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is expected, json is the fallback
+    _loads = json.loads
+
+ATTACHMENT_RE = re.compile(r"<attachment:(\d+)>")
+_ATTACHMENT_TAG = "<attachment:"
+
+PANEL_WIDTH = 480
+PANEL_BG = (250, 250, 250)
+TEXT_COLOR = (20, 20, 20)
+MARGIN = 24
+
+FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/Library/Fonts/Arial.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+]
+
+
+def read_chat_records(chat_path: Path) -> List[Dict[str, Any]]:
+    """Read NDJSON chat records, one per line."""
+    with chat_path.open("rb") as f:
+        raw = f.read()
+    return [_loads(line) for line in raw.splitlines() if line.strip()]
+
+
+def parse_steps(messages: List[Dict[str, str]], attachments: List[str]) -> List[Dict[str, Optional[str]]]:
+    """Pair each assistant action with the screenshot its user turn referenced."""
+    steps: List[Dict[str, Optional[str]]] = []
+    pending_image: Optional[str] = None
+    n_attachments = len(attachments)
+    for msg in messages:
+        role = msg["role"]
+        if role == "system":
+            continue
+        content = msg.get("content", "")
+        if role == "user":
+            # The content is a template this pipeline wrote itself, so a
+            # plain string scan is enough; no regex call per message.
+            i = content.rfind(_ATTACHMENT_TAG)
+            if i != -1:
+                end = content.find(">", i)
+                if end != -1:
+                    idx = int(content[i + len(_ATTACHMENT_TAG):end])
+                    if idx < n_attachments:
+                        pending_image = attachments[idx]
+        elif role == "assistant":
+            steps.append({"image": pending_image, "action": content})
+            pending_image = None
+    return steps
+
+
+@functools.lru_cache(maxsize=64)
+def load_font_prefer_system(size: int) -> ImageFont.FreeTypeFont:
+    """Load the first available system font at the given size (cached)."""
+    for path in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+# Measured word widths keyed by (font, word); fonts are cached above, so
+# repeated action texts never hit the rasterizer twice.
+_WORD_WIDTH_CACHE: Dict[Tuple[ImageFont.FreeTypeFont, str], float] = {}
+
+
+def _word_width(draw: ImageDraw.ImageDraw, word: str, font: ImageFont.FreeTypeFont) -> float:
+    key = (font, word)
+    width = _WORD_WIDTH_CACHE.get(key)
+    if width is None:
+        width = draw.textlength(word, font=font)
+        _WORD_WIDTH_CACHE[key] = width
+    return width
+
+
+def wrap_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
+    """Greedy word wrap summing cached per-word widths.
+
+    Accumulating word + space widths keeps the wrap linear in the number of
+    words, instead of re-measuring the growing line for every append.
+    """
+    space_width = _word_width(draw, " ", font)
+    lines: List[str] = []
+    line_words: List[str] = []
+    line_width = 0.0
+    for word in text.split():
+        width = _word_width(draw, word, font)
+        candidate = line_width + (space_width if line_words else 0.0) + width
+        if candidate <= max_width or not line_words:
+            line_words.append(word)
+            line_width = candidate
+        else:
+            lines.append(" ".join(line_words))
+            line_words = [word]
+            line_width = width
+    if line_words:
+        lines.append(" ".join(line_words))
+    return lines
+
+
+def choose_font_that_fits(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    max_width: int,
+    max_height: int,
+    start_size: int = 36,
+    min_size: int = 12,
+) -> Tuple[ImageFont.FreeTypeFont, List[str], int]:
+    """Binary-search the largest font size whose wrapped text fits the panel."""
+    best: Optional[Tuple[ImageFont.FreeTypeFont, List[str], int]] = None
+    lo, hi = min_size, start_size
+    while lo <= hi:
+        size = (lo + hi) // 2
+        font = load_font_prefer_system(size)
+        lines = wrap_text(draw, text, font, max_width)
+        line_height = int(size * 1.3)
+        if line_height * len(lines) <= max_height:
+            best = (font, lines, line_height)
+            lo = size + 1
+        else:
+            hi = size - 1
+    if best is not None:
+        return best
+    font = load_font_prefer_system(min_size)
+    return font, wrap_text(draw, text, font, max_width), int(min_size * 1.3)
+
+
+def render_frame(
+    image: Union[str, Path, Image.Image],
+    action_text: str,
+    target_size: Optional[Tuple[int, int]] = None,
+    panel_width: int = PANEL_WIDTH,
+) -> np.ndarray:
+    """Render one slide: screenshot on the left, action text panel on the right.
+
+    Accepts either an image path or an already-decoded PIL Image, so callers
+    that cache decoded screenshots can skip the redundant open+decode.
+    """
+    if isinstance(image, Image.Image):
+        img = image
+    else:
+        img = Image.open(image).convert("RGB")
+    if target_size is not None and img.size != target_size:
+        # Downscales get the cheaper bilinear filter; only upscales need
+        # bicubic. Most frames already match the base size and skip this.
+        if target_size[0] <= img.size[0] and target_size[1] <= img.size[1]:
+            resample = Image.BILINEAR
+        else:
+            resample = Image.BICUBIC
+        img = img.resize(target_size, resample)
+
+    # Compose screenshot + panel background in one NumPy allocation; PIL is
+    # only brought back in for the text pass, which it has to do anyway.
+    img_w, img_h = img.size
+    arr = np.empty((img_h, img_w + panel_width, 3), dtype=np.uint8)
+    arr[:, :img_w] = np.asarray(img)
+    arr[:, img_w:] = PANEL_BG
+
+    canvas = Image.fromarray(arr)
+    draw = ImageDraw.Draw(canvas)
+
+    font, lines, line_height = choose_font_that_fits(
+        draw, action_text, panel_width - 2 * MARGIN, img.height - 2 * MARGIN
+    )
+    y = MARGIN
+    for line in lines:
+        draw.text((img.width + MARGIN, y), line, font=font, fill=TEXT_COLOR)
+        y += line_height
+
+    # asarray exposes PIL's buffer as a (read-only) view where possible;
+    # np.array would memcpy the whole frame before the encoder sees it.
+    return np.asarray(canvas)
+
+
+def steps_to_video(steps: List[Dict[str, Optional[str]]], output_path: Path, step_duration: float = 2.0) -> bool:
+    """Encode the slides for one task into an mp4. Returns False if no frames."""
+    base_size = None
+    for step in steps:
+        p = step.get("image")
+        if p and Path(p).exists():
+            # .size comes from the image header; no pixel decode happens here.
+            with Image.open(p) as im:
+                base_size = im.size
+            break
+    if base_size is None:
+        return False
+
+    # One frame per step at fps = 1/step_duration gives the same wall-clock
+    # duration as repeating frames at a higher rate, without re-encoding
+    # identical frames step_duration*fps times.
+    cached_path: Optional[str] = None
+    cached_img: Optional[Image.Image] = None
+    writer = imageio.get_writer(
+        str(output_path),
+        fps=1.0 / step_duration,
+        codec="libx264",
+        ffmpeg_params=["-tune", "stillimage", "-preset", "veryfast"],
+    )
+    try:
+        for step in steps:
+            p = step.get("image")
+            if not p or not Path(p).exists():
+                continue
+            if p != cached_path:
+                cached_img = Image.open(p).convert("RGB")
+                cached_path = p
+            frame = render_frame(cached_img, step.get("action") or "", target_size=base_size)
+            writer.append_data(frame)
+    finally:
+        writer.close()
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-root", default="data", help="Recorder output directory")
+    parser.add_argument("--step-duration", type=float, default=2.0, help="Seconds per slide")
+    args = parser.parse_args()
+
+    data_root = Path(args.data_root)
+    for task_dir in find_task_directories(data_root):
+        chat_path = task_dir / "chat.jsonl"
+        if not chat_path.exists():
+            continue
+        records = read_chat_records(chat_path)
+        if not records:
+            continue
+        rec = records[0]
+        steps = parse_steps(rec.get("messages", []), rec.get("attachments", []))
+        out_path = task_dir / "chat_video.mp4"
+        if steps_to_video(steps, out_path, step_duration=args.step_duration):
+            print(f"✓ {task_dir.name}: {len(steps)} steps -> {out_path}")
+        else:
+            print(f"✗ {task_dir.name}: no renderable steps")
+
+
+if __name__ == "__main__":
+    main()